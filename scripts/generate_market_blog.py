@@ -1,28 +1,48 @@
 from __future__ import annotations
 
+import argparse
+import cProfile
 import datetime as dt
+import functools
 import html
+import io
 import json
+import os
+import pstats
 import re
 import urllib.parse
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict
 
+import numpy as np
 import pandas as pd
 import requests
+from lxml import etree as ET
 from pykrx import stock
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 ROOT = Path(__file__).resolve().parent.parent
 REPORT_DIR = ROOT / "reports"
 INDEX_FILE = ROOT / "index.html"
 SITEMAP_FILE = ROOT / "sitemap.xml"
 REPORT_META_FILE = REPORT_DIR / "report_index.json"
+REPORT_NAME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})\.html")
+# 기계 생성 캐시는 리포트와 분리해 커밋하지 않음 (CI에서는 actions/cache로 복원)
+CACHE_DIR = ROOT / "cache"
+NEWS_CACHE_FILE = CACHE_DIR / "news_cache.json"
 
 SITE_NAME = "K-Stock Daily Pulse"
 SITE_URL = "https://pre-visual.web.app"
 ADSENSE_CLIENT = "ca-pub-6025469498161210"
-NEWS_CACHE: Dict[str, List[Dict[str, str]]] = {}
+MARKETS = ("KOSPI", "KOSDAQ")
+# 일자 풀 × 시장 풀(2)만큼 KRX에 동시 요청이 나가므로 일자 풀은 작게 유지
+FETCH_WORKERS = 4
+NEWS_WORKERS = 8
+# cache_key -> {"items": [...], "fetched_at": ISO 시각 또는 None(수집 실패, 저장하지 않음)}
+NEWS_CACHE: Dict[str, Dict[str, Any]] = {}
+NEWS_CACHE_TTL = dt.timedelta(hours=24)
 NEWS_LOOKBACK_DAYS = 3
 NEWS_TOP_LIMIT = 5
 MAX_NEWS_PER_STOCK = 3
@@ -44,6 +64,12 @@ TRUSTED_NEWS_SOURCES = {
     "딜사이트",
     "Chosunbiz",
 }
+DIRECTION_WORDS = {
+    "up": ("급등", "상승", "호재", "실적", "수주", "계약"),
+    "down": ("급락", "하락", "악재", "리스크", "우려", "적자"),
+}
+# 방향 키워드 포함 여부를 헤드라인당 한 번의 정규식 검색으로 판정
+DIRECTION_WORD_RE = {d: re.compile("|".join(map(re.escape, words))) for d, words in DIRECTION_WORDS.items()}
 SOURCE_ALIAS = {
     "chosunbiz": "Chosunbiz",
     "조선비즈": "Chosunbiz",
@@ -52,34 +78,83 @@ SOURCE_ALIAS = {
 }
 
 
-def fmt_int(v: float) -> str:
-    return f"{int(v):,}"
+def build_http_session() -> requests.Session:
+    # 뉴스 RSS는 모두 같은 호스트로 가므로 keep-alive 연결을 재사용해 TLS 핸드셰이크를 줄인다
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retry))
+    session.headers.update(
+        {
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": f"Mozilla/5.0 (compatible; {SITE_NAME})",
+        }
+    )
+    return session
 
 
-def stock_comment(rate: float, turnover: float, median_turnover: float) -> str:
-    if rate >= 20:
-        trend = "급등 강세"
-    elif rate >= 10:
-        trend = "강한 상승"
-    elif rate >= 5:
-        trend = "상승 우위"
-    elif rate <= -20:
-        trend = "급락 약세"
-    elif rate <= -10:
-        trend = "강한 하락"
-    elif rate <= -5:
-        trend = "하락 우위"
-    else:
-        trend = "보합권 이탈"
+HTTP_SESSION = build_http_session()
 
-    if median_turnover > 0 and turnover >= median_turnover * 5:
-        flow = "거래대금 집중"
-    elif median_turnover > 0 and turnover >= median_turnover * 2:
-        flow = "거래 유입"
-    else:
-        flow = "거래 평이"
 
-    return f"{trend} · {flow}"
+def fmt_ints(values: pd.Series) -> List[str]:
+    return [f"{v:,}" for v in values.astype(np.int64).tolist()]
+
+
+def fast_median(values: np.ndarray) -> float:
+    # 전체 정렬 대신 introselect(np.partition)로 중앙값 위치만 확정
+    n = values.size
+    if n == 0:
+        return float("nan")
+    mid = n // 2
+    if n % 2:
+        return float(np.partition(values, mid)[mid])
+    part = np.partition(values, [mid - 1, mid])
+    return float((part[mid - 1] + part[mid]) / 2)
+
+
+# 등락률 절댓값 구간별 강도: [0, 5) 보합권, [5, 10), [10, 20), [20, inf)
+TREND_BINS = [0, 5, 10, 20, np.inf]
+TREND_LABELS = np.array(
+    [
+        ["보합권 이탈", "상승 우위", "강한 상승", "급등 강세"],
+        ["보합권 이탈", "하락 우위", "강한 하락", "급락 약세"],
+    ]
+)
+# 중앙값 대비 거래대금 배수 구간: [0, 2), [2, 5), [5, inf)
+FLOW_BINS = [0, 2, 5, np.inf]
+FLOW_LABELS = ["거래 평이", "거래 유입", "거래대금 집중"]
+
+
+def top_bottom_positions(values: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    # 상위/하위 k개 경계값을 한 번의 argpartition으로 구한 뒤, 뽑힌 k개만 정렬.
+    # 동률은 원래 위치가 앞선 종목을 우선해 nlargest/nsmallest(keep="first")와 같은 결과를 낸다
+    n = values.size
+    if n <= 2 * k:
+        pos = np.arange(n)
+        return np.lexsort((pos, -values))[:k], np.lexsort((pos, values))[:k]
+    idx = np.argpartition(values, [k - 1, n - k])
+    top = pick_with_ties(values, values[idx[n - k]], k, largest=True)
+    bottom = pick_with_ties(values, values[idx[k - 1]], k, largest=False)
+    return top, bottom
+
+
+def pick_with_ties(values: np.ndarray, bound: float, k: int, largest: bool) -> np.ndarray:
+    inside = np.flatnonzero(values > bound if largest else values < bound)
+    ties = np.flatnonzero(values == bound)[: k - inside.size]
+    pos = np.concatenate([inside, ties])
+    return pos[np.lexsort((pos, -values[pos] if largest else values[pos]))]
+
+
+def stock_comments(sub: pd.DataFrame, median_turnover: float) -> pd.Series:
+    rate = sub["등락률"].to_numpy()
+    level = pd.cut(np.abs(rate), bins=TREND_BINS, right=False, labels=False)
+    trend = pd.Series(TREND_LABELS[(rate < 0).astype(int), level], index=sub.index)
+    if median_turnover > 0:
+        flow = pd.cut(
+            sub["거래대금"] / median_turnover, bins=FLOW_BINS, right=False, labels=FLOW_LABELS
+        ).astype(str)
+    else:
+        flow = pd.Series(FLOW_LABELS[0], index=sub.index)
+    return trend.str.cat(flow, sep=" · ")
 
 
 def quant_reason(rate: float, turnover: float, median_turnover: float, direction: str) -> str:
@@ -108,10 +183,12 @@ def quant_reason(rate: float, turnover: float, median_turnover: float, direction
     return f"{momentum}. {flow}되어 수급 영향이 크게 반영된 흐름으로 해석됩니다."
 
 
+# 병목은 HTTP GET(요청당 ~200ms)이고 파이썬 스코어링/중복 제거는 1ms 미만이다.
+# 여기서 미세 최적화(JIT 등)하지 말고 HTTP 병렬화/캐시에 집중할 것 (--profile로 확인 가능)
 def fetch_related_news(stock_name: str, report_day: dt.date, direction: str) -> List[Dict[str, str]]:
     cache_key = f"{stock_name}|{report_day.isoformat()}|{direction}"
     if cache_key in NEWS_CACHE:
-        return NEWS_CACHE[cache_key]
+        return NEWS_CACHE[cache_key]["items"]
 
     after = (report_day - dt.timedelta(days=2)).strftime("%Y-%m-%d")
     before = (report_day + dt.timedelta(days=1)).strftime("%Y-%m-%d")
@@ -121,11 +198,12 @@ def fetch_related_news(stock_name: str, report_day: dt.date, direction: str) ->
     url = f"https://news.google.com/rss/search?q={encoded}&hl=ko&gl=KR&ceid=KR:ko"
 
     try:
-        resp = requests.get(url, timeout=8)
+        resp = HTTP_SESSION.get(url, timeout=8)
         resp.raise_for_status()
-        root = ET.fromstring(resp.text)
+        # bytes를 그대로 C 파서에 넘겨 별도 유니코드 디코딩을 생략
+        root = ET.fromstring(resp.content, ET.XMLParser(resolve_entities=False, no_network=True))
     except Exception:
-        NEWS_CACHE[cache_key] = []
+        NEWS_CACHE[cache_key] = {"items": [], "fetched_at": None}
         return []
 
     def normalize_source_name(source: str) -> str:
@@ -141,7 +219,6 @@ def fetch_related_news(stock_name: str, report_day: dt.date, direction: str) ->
             return h.strip(), src.strip()
         return title.strip(), ""
 
-    direction_words = {"up": ["급등", "상승", "호재", "실적", "수주", "계약"], "down": ["급락", "하락", "악재", "리스크", "우려", "적자"]}
     candidates = []
     for item in root.findall("./channel/item"):
         title = item.findtext("title", "").strip()
@@ -157,7 +234,7 @@ def fetch_related_news(stock_name: str, report_day: dt.date, direction: str) ->
         score = 0
         if stock_name in headline:
             score += 4
-        if any(w in headline for w in direction_words[direction]):
+        if DIRECTION_WORD_RE[direction].search(headline):
             score += 2
         if source in TRUSTED_NEWS_SOURCES:
             score += 3
@@ -198,27 +275,43 @@ def fetch_related_news(stock_name: str, report_day: dt.date, direction: str) ->
         if len(items) >= MAX_NEWS_PER_STOCK:
             break
 
-    NEWS_CACHE[cache_key] = items
+    NEWS_CACHE[cache_key] = {"items": items, "fetched_at": dt.datetime.now().isoformat(timespec="seconds")}
     return items
 
 
+NewsKey = tuple[str, dt.date, str]
+
+
+def news_targets(report_day: dt.date, gainers: pd.DataFrame, losers: pd.DataFrame) -> List[NewsKey]:
+    targets = [(str(n), report_day, "up") for n in gainers["종목명"].head(NEWS_TOP_LIMIT)]
+    targets += [(str(n), report_day, "down") for n in losers["종목명"].head(NEWS_TOP_LIMIT)]
+    return targets
+
+
+def prefetch_news(targets: set[NewsKey]) -> Dict[NewsKey, List[Dict[str, str]]]:
+    # RSS 조회는 종목별로 독립적인 네트워크 I/O이므로 전체 일자의 중복 없는 키를 한 풀에서 동시 요청
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=NEWS_WORKERS) as executor:
+        futures = {executor.submit(fetch_related_news, *key): key for key in targets}
+        return {futures[f]: f.result() for f in as_completed(futures)}
+
+
 def build_deep_cards(
     sub: pd.DataFrame,
     direction: str,
     report_day: dt.date,
-    latest_day: dt.date,
     median_turnover: float,
+    news: Dict[NewsKey, List[Dict[str, str]]],
 ) -> str:
     cards = []
-    can_search_news = (latest_day - report_day).days <= NEWS_LOOKBACK_DAYS
-    for i, (_, r) in enumerate(sub.head(10).iterrows(), start=1):
-        name = str(r["종목명"])
-        ticker = str(r["티커"])
-        rate = float(r["등락률"])
-        turnover = float(r["거래대금"])
-        news_items = []
-        if can_search_news and i <= NEWS_TOP_LIMIT:
-            news_items = fetch_related_news(name, report_day, direction)
+    cols = ["종목명", "티커", "등락률", "거래대금"]
+    for i, (name, ticker, rate, turnover) in enumerate(
+        sub.head(10)[cols].itertuples(index=False, name=None), start=1
+    ):
+        name = str(name)
+        ticker = str(ticker)
+        news_items = news.get((name, report_day, direction), []) if i <= NEWS_TOP_LIMIT else []
         base_reason = quant_reason(rate, turnover, median_turnover, direction)
 
         if news_items:
@@ -245,23 +338,26 @@ def build_deep_cards(
     return "".join(cards)
 
 
+@functools.lru_cache(maxsize=None)
+def ticker_name(ticker: str) -> str:
+    # 종목명은 거래일마다 바뀌지 않으므로 프로세스 내에서 한 번만 조회
+    return stock.get_market_ticker_name(ticker)
+
+
 def enrich(df: pd.DataFrame) -> pd.DataFrame:
-    names = {ticker: stock.get_market_ticker_name(ticker) for ticker in df.index}
-    out = df.copy()
-    out["티커"] = out.index
-    out["종목명"] = out.index.map(names)
-    return out
+    return df.assign(티커=df.index, 종목명=df.index.map(ticker_name))
 
 
-def page_template(title: str, description: str, body: str) -> str:
-    return f"""<!doctype html>
+PAGE_HEAD_TOP = f"""<!doctype html>
 <html lang=\"ko\">
   <head>
     <meta charset=\"UTF-8\" />
     <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
     <meta name=\"google-adsense-account\" content=\"{ADSENSE_CLIENT}\" />
-    <meta name=\"description\" content=\"{description}\" />
-    <title>{title}</title>
+    <meta name=\"description\" content=\""""
+PAGE_HEAD_MID = """\" />
+    <title>"""
+PAGE_HEAD_BOT = f"""</title>
     <link rel=\"preconnect\" href=\"https://fonts.googleapis.com\" />
     <link rel=\"preconnect\" href=\"https://fonts.gstatic.com\" crossorigin />
     <link href=\"https://fonts.googleapis.com/css2?family=Merriweather:wght@700;900&family=Source+Sans+3:wght@400;600;700&display=swap\" rel=\"stylesheet\" />
@@ -269,96 +365,171 @@ def page_template(title: str, description: str, body: str) -> str:
     <script async src=\"https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client={ADSENSE_CLIENT}\" crossorigin=\"anonymous\"></script>
   </head>
   <body>
-    {body}
+    """
+PAGE_END = """
   </body>
 </html>
 """
 
+REPORT_HEADER_HTML = f"""<header class=\"site-header\">
+  <div class=\"header-inner\">
+    <a class=\"brand\" href=\"/\">{SITE_NAME}</a>
+    <nav class=\"site-nav\" aria-label=\"리포트 메뉴\">
+      <a href=\"/\">리포트 허브</a>
+      <a href=\"/privacy.html\">개인정보처리방침</a>
+      <a href=\"/terms.html\">이용약관</a>
+    </nav>
+  </div>
+</header>"""
+
+REPORT_FOOTER_HTML = """<footer class=\"site-footer\">
+    <p>데이터 출처: KRX 일별 시세(수집 시점 기준)</p>
+    <p>면책: 본 페이지는 투자 자문이 아닙니다.</p>
+  </footer>"""
 
-def build_day_report(
-    day: dt.date,
-    latest_day: dt.date,
-    rank: int,
-    total_days: int,
-    prev_day: dt.date | None,
-    next_day: dt.date | None,
-) -> Dict[str, str]:
-    d = day.strftime("%Y%m%d")
-    label = day.strftime("%Y-%m-%d")
-    df_kospi = stock.get_market_ohlcv_by_ticker(d, market="KOSPI")
-    df_kosdaq = stock.get_market_ohlcv_by_ticker(d, market="KOSDAQ")
-    df = pd.concat([df_kospi, df_kosdaq], axis=0)
+INDEX_HEADER_HTML = f"""<header class=\"site-header\">
+  <div class=\"header-inner\">
+    <a class=\"brand\" href=\"/\">{SITE_NAME}</a>
+    <nav class=\"site-nav\" aria-label=\"주요 메뉴\">
+      <a href=\"#reports\">누적 리포트 아카이브</a>
+      <a href=\"/privacy.html\">개인정보처리방침</a>
+      <a href=\"/terms.html\">이용약관</a>
+    </nav>
+  </div>
+</header>"""
+
+
+def page_template(title: str, description: str, body: List[str]) -> str:
+    # 변하지 않는 <head> 골격은 모듈 상수로 한 번만 만들고, 제목/설명/본문 조각과 함께 한 번에 join
+    return "".join((PAGE_HEAD_TOP, description, PAGE_HEAD_MID, title, PAGE_HEAD_BOT, *body, PAGE_END))
+
+
+def cached_ohlcv(d: str, market: str, cacheable: bool) -> pd.DataFrame:
+    # 지난 거래일의 장마감 시세는 바뀌지 않으므로 디스크에 보관해 재실행 시 재사용
+    path = CACHE_DIR / f"{d}-{market}.parquet"
+    if cacheable and path.exists():
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            pass
+
+    df = stock.get_market_ohlcv_by_ticker(d, market=market)
+    if cacheable and not df.empty:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(path)
+        except Exception:
+            pass
+    return df
+
+
+# 표 행 템플릿: {0} 순위, {1} 등락 배지 클래스, {2}~ ROW_COLUMNS 순서의 값
+ROW_COLUMNS = ["종목명", "등락률_s", "티커", "종가_s", "거래량_s", "거래대금_s", "코멘트"]
+ROW_TMPL = (
+    "<tr>"
+    "<td>{0}</td>"
+    "<td><div class=\"stock-main\">{2} <span class=\"rate-badge {1}\">{3}</span></div></td>"
+    "<td>{4}</td>"
+    "<td>{5}</td>"
+    "<td>{6}</td>"
+    "<td>{7}</td>"
+    "<td>{8}</td>"
+    "</tr>"
+).format
+
+
+def with_display_columns(sub: pd.DataFrame, median_turnover: float) -> pd.DataFrame:
+    # 렌더링에 쓰는 문자열 컬럼을 한 번에 붙여 새 프레임으로 반환 (원본 슬라이스는 수정하지 않음)
+    return sub.assign(
+        코멘트=stock_comments(sub, median_turnover),
+        종가_s=fmt_ints(sub["종가"]),
+        거래량_s=fmt_ints(sub["거래량"]),
+        거래대금_s=fmt_ints(sub["거래대금"]),
+        등락률_s=sub["등락률"].map("{:.2f}%".format),
+    )
+
+
+def fetch_day(d: str) -> pd.DataFrame:
+    # 당일 데이터는 수집 시점에 따라 미완성일 수 있으므로 항상 새로 조회
+    # pykrx 영업일 목록은 Timestamp일 수 있어 date 대신 YYYYMMDD 문자열로 비교
+    cacheable = d < dt.date.today().strftime("%Y%m%d")
+    # KOSPI/KOSDAQ 조회도 서로 독립적이므로 시장별로 동시에 요청
+    with ThreadPoolExecutor(max_workers=len(MARKETS)) as executor:
+        frames = list(executor.map(lambda market: cached_ohlcv(d, market, cacheable), MARKETS))
+    return pd.concat(frames, axis=0, sort=False)
+
+
+def select_movers(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, float]:
     df = enrich(df)
 
     # 거래 정지/초저유동성/비정상 급등락(권리락·병합 등 특수 케이스) 제외
-    df = df[(df["거래량"] >= 1000) & (df["등락률"] <= 30) & (df["등락률"] >= -30)].copy()
+    volume = df["거래량"].to_numpy()
+    rate = df["등락률"].to_numpy()
+    df = df.iloc[(volume >= 1000) & (rate >= -30) & (rate <= 30)]
 
-    gainers = df.sort_values("등락률", ascending=False).head(30).copy()
-    losers = df.sort_values("등락률", ascending=True).head(30).copy()
+    median_turnover = fast_median(df["거래대금"].to_numpy())
+    gainers_pos, losers_pos = top_bottom_positions(df["등락률"].to_numpy(), 30)
+    gainers = with_display_columns(df.iloc[gainers_pos], median_turnover)
+    losers = with_display_columns(df.iloc[losers_pos], median_turnover)
+    return df, gainers, losers, median_turnover
 
-    median_turnover = float(df["거래대금"].median())
-    for sub in (gainers, losers):
-        sub["코멘트"] = sub.apply(
-            lambda r: stock_comment(float(r["등락률"]), float(r["거래대금"]), median_turnover), axis=1
-        )
-    gainers_deep = build_deep_cards(gainers, "up", day, latest_day, median_turnover)
-    losers_deep = build_deep_cards(losers, "down", day, latest_day, median_turnover)
 
-    adv = int((df["등락률"] > 0).sum())
-    dec = int((df["등락률"] < 0).sum())
-    flat = int((df["등락률"] == 0).sum())
-    total_turnover = float(df["거래대금"].sum())
+def build_day_report(
+    day: dt.date,
+    label: str,
+    df: pd.DataFrame,
+    gainers: pd.DataFrame,
+    losers: pd.DataFrame,
+    median_turnover: float,
+    news: Dict[NewsKey, List[Dict[str, str]]],
+    rank: int,
+    total_days: int,
+    prev_label: str | None,
+    next_label: str | None,
+) -> Dict[str, str]:
+    gainers_deep = build_deep_cards(gainers, "up", day, median_turnover, news)
+    losers_deep = build_deep_cards(losers, "down", day, median_turnover, news)
+
+    rate = df["등락률"].to_numpy()
+    adv = int(np.count_nonzero(rate > 0))
+    dec = int(np.count_nonzero(rate < 0))
+    # 필터에서 NaN이 제거되었으므로 나머지는 모두 보합
+    flat = len(rate) - adv - dec
+    total_turnover = float(df["거래대금"].to_numpy().sum())
     top_focus = float(gainers.head(5)["거래대금"].sum()) / total_turnover * 100 if total_turnover else 0.0
 
     def to_rows(sub: pd.DataFrame, direction: str) -> str:
-        rows = []
-        for i, (_, r) in enumerate(sub.iterrows(), start=1):
-            rate = float(r["등락률"])
-            rate_cls = "rate-up" if direction == "up" else "rate-down"
-            rows.append(
-                "<tr>"
-                f"<td>{i}</td>"
-                f"<td><div class=\"stock-main\">{r['종목명']} <span class=\"rate-badge {rate_cls}\">{rate:.2f}%</span></div></td>"
-                f"<td>{r['티커']}</td>"
-                f"<td>{fmt_int(r['종가'])}</td>"
-                f"<td>{fmt_int(r['거래량'])}</td>"
-                f"<td>{fmt_int(r['거래대금'])}</td>"
-                f"<td>{r['코멘트']}</td>"
-                "</tr>"
-            )
+        rate_cls = "rate-up" if direction == "up" else "rate-down"
+        rows = [
+            ROW_TMPL(i, rate_cls, *row)
+            for i, row in enumerate(sub[ROW_COLUMNS].itertuples(index=False, name=None), start=1)
+        ]
         return "\n".join(rows)
 
     def to_mobile_cards(sub: pd.DataFrame, direction: str) -> str:
-        cards = []
-        for i, (_, r) in enumerate(sub.iterrows(), start=1):
-            rate = float(r["등락률"])
-            rate_cls = "rate-up" if direction == "up" else "rate-down"
-            cards.append(
-                "<article class=\"mobile-item\">"
-                f"<p class=\"mobile-top\"><strong>{i}. {r['종목명']}</strong> <span class=\"rate-badge {rate_cls}\">{rate:.2f}%</span></p>"
-                f"<p class=\"mobile-meta\">티커 {r['티커']} · 종가 {fmt_int(r['종가'])}원</p>"
-                f"<p class=\"mobile-meta\">거래량 {fmt_int(r['거래량'])} · 거래대금 {fmt_int(r['거래대금'])}원</p>"
-                f"<p class=\"mobile-comment\">{r['코멘트']}</p>"
-                "</article>"
+        rate_cls = "rate-up" if direction == "up" else "rate-down"
+        cards = [
+            "<article class=\"mobile-item\">"
+            f"<p class=\"mobile-top\"><strong>{i}. {name}</strong> <span class=\"rate-badge {rate_cls}\">{rate}</span></p>"
+            f"<p class=\"mobile-meta\">티커 {ticker} · 종가 {close}원</p>"
+            f"<p class=\"mobile-meta\">거래량 {volume} · 거래대금 {turnover}원</p>"
+            f"<p class=\"mobile-comment\">{comment}</p>"
+            "</article>"
+            for i, (name, rate, ticker, close, volume, turnover, comment) in enumerate(
+                sub[ROW_COLUMNS].itertuples(index=False, name=None), start=1
             )
+        ]
         return "\n".join(cards)
 
-    prev_link = f"/reports/{prev_day.strftime('%Y-%m-%d')}.html" if prev_day else "#"
-    next_link = f"/reports/{next_day.strftime('%Y-%m-%d')}.html" if next_day else "#"
-    prev_class = "" if prev_day else " disabled"
-    next_class = "" if next_day else " disabled"
+    prev_link = f"/reports/{prev_label}.html" if prev_label else "#"
+    next_link = f"/reports/{next_label}.html" if next_label else "#"
+    prev_class = "" if prev_label else " disabled"
+    next_class = "" if next_label else " disabled"
 
-    body = f"""
-<header class=\"site-header\">
-  <div class=\"header-inner\">
-    <a class=\"brand\" href=\"/\">{SITE_NAME}</a>
-    <nav class=\"site-nav\" aria-label=\"리포트 메뉴\">
-      <a href=\"/\">리포트 허브</a>
-      <a href=\"/privacy.html\">개인정보처리방침</a>
-      <a href=\"/terms.html\">이용약관</a>
-    </nav>
-  </div>
-</header>
+    # 큰 표/카드 조각은 다시 복사하지 않도록 조각 리스트로 두고 page_template에서 한 번에 join
+    body = [
+        f"""
+{REPORT_HEADER_HTML}
 
 <main class=\"app\">
   <section class=\"hero\">
@@ -381,12 +552,16 @@ def build_day_report(
           <tr><th>순위</th><th>종목명/등락률</th><th>티커</th><th>종가(원)</th><th>거래량</th><th>거래대금(원)</th><th>해석</th></tr>
         </thead>
         <tbody>
-          {to_rows(gainers, "up")}
+          """,
+        to_rows(gainers, "up"),
+        """
         </tbody>
       </table>
     </div>
     <div class=\"mobile-list\">
-      {to_mobile_cards(gainers, "up")}
+      """,
+        to_mobile_cards(gainers, "up"),
+        """
     </div>
   </section>
 
@@ -398,26 +573,34 @@ def build_day_report(
           <tr><th>순위</th><th>종목명/등락률</th><th>티커</th><th>종가(원)</th><th>거래량</th><th>거래대금(원)</th><th>해석</th></tr>
         </thead>
         <tbody>
-          {to_rows(losers, "down")}
+          """,
+        to_rows(losers, "down"),
+        """
         </tbody>
       </table>
     </div>
     <div class=\"mobile-list\">
-      {to_mobile_cards(losers, "down")}
+      """,
+        to_mobile_cards(losers, "down"),
+        """
     </div>
   </section>
 
   <section class=\"panel\">
     <h2>상승 종목 구체 분석 + 관련 뉴스</h2>
     <div class=\"insight-grid\">
-      {gainers_deep}
+      """,
+        gainers_deep,
+        """
     </div>
   </section>
 
   <section class=\"panel\">
     <h2>하락 종목 구체 분석 + 관련 뉴스</h2>
     <div class=\"insight-grid\">
-      {losers_deep}
+      """,
+        losers_deep,
+        f"""
     </div>
   </section>
 
@@ -435,12 +618,10 @@ def build_day_report(
     ></script>
   </section>
 
-  <footer class=\"site-footer\">
-    <p>데이터 출처: KRX 일별 시세(수집 시점 기준)</p>
-    <p>면책: 본 페이지는 투자 자문이 아닙니다.</p>
-  </footer>
+  {REPORT_FOOTER_HTML}
 </main>
-"""
+""",
+    ]
 
     html = page_template(
         title=f"{label} 한국주식 상승·하락 30 분석 | {SITE_NAME}",
@@ -455,8 +636,8 @@ def build_day_report(
         "date": label,
         "path": f"reports/{label}.html",
         "html": html,
-        "strong": f"{strongest['종목명']} ({float(strongest['등락률']):.2f}%)",
-        "weak": f"{weakest['종목명']} ({float(weakest['등락률']):.2f}%)",
+        "strong": f"{strongest['종목명']} ({strongest['등락률_s']})",
+        "weak": f"{weakest['종목명']} ({weakest['등락률_s']})",
         "advance": adv,
         "decline": dec,
         "flat": flat,
@@ -465,13 +646,11 @@ def build_day_report(
 
 
 def build_index(reports: List[Dict[str, str]]) -> str:
-    cards = []
     sorted_reports = sorted(reports, key=lambda x: x["date"], reverse=True)
     latest = sorted_reports[0] if sorted_reports else None
 
-    for r in sorted_reports:
-        cards.append(
-            f"""
+    cards = [
+        f"""
 <article class=\"report-card\">
   <h3><a href=\"/{r['path']}\">{r['date']} 주식장 분석</a></h3>
   <p>상승 대표: {r['strong']}</p>
@@ -480,7 +659,8 @@ def build_index(reports: List[Dict[str, str]]) -> str:
   <a class=\"read-link\" href=\"/{r['path']}\">하루치 상세 보기</a>
 </article>
 """
-        )
+        for r in sorted_reports
+    ]
 
     latest_box = ""
     if latest:
@@ -496,17 +676,9 @@ def build_index(reports: List[Dict[str, str]]) -> str:
   </section>
 """
 
-    body = f"""
-<header class=\"site-header\">
-  <div class=\"header-inner\">
-    <a class=\"brand\" href=\"/\">{SITE_NAME}</a>
-    <nav class=\"site-nav\" aria-label=\"주요 메뉴\">
-      <a href=\"#reports\">누적 리포트 아카이브</a>
-      <a href=\"/privacy.html\">개인정보처리방침</a>
-      <a href=\"/terms.html\">이용약관</a>
-    </nav>
-  </div>
-</header>
+    body = [
+        f"""
+{INDEX_HEADER_HTML}
 
 <main class=\"app\">
   <section class=\"hero\">
@@ -521,7 +693,9 @@ def build_index(reports: List[Dict[str, str]]) -> str:
   <section id=\"reports\" class=\"panel\">
     <h2>누적 일자별 리포트</h2>
     <div class=\"cards\">
-      {''.join(cards)}
+      """,
+        *cards,
+        f"""
     </div>
   </section>
 
@@ -540,7 +714,8 @@ def build_index(reports: List[Dict[str, str]]) -> str:
     <p>최종 생성일: {dt.date.today().strftime('%Y-%m-%d')}</p>
   </footer>
 </main>
-"""
+""",
+    ]
 
     return page_template(
         title=f"{SITE_NAME} | 최근 2주 한국 주식 상승·하락 30 분석",
@@ -557,16 +732,18 @@ def build_sitemap(report_paths: List[str]) -> str:
         *[f"/{p}" for p in report_paths],
     ]
 
-    rows = []
+    buf = io.StringIO()
+    buf.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n")
     for u in urls:
-        rows.append(
+        buf.write(
             "  <url>\n"
             f"    <loc>{SITE_URL}{u}</loc>\n"
             "    <changefreq>daily</changefreq>\n"
             "    <priority>0.8</priority>\n"
-            "  </url>"
+            "  </url>\n"
         )
-    return "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n<urlset xmlns=\"http://www.sitemaps.org/schemas/sitemap/0.9\">\n" + "\n".join(rows) + "\n</urlset>\n"
+    buf.write("</urlset>\n")
+    return buf.getvalue()
 
 
 def load_existing_meta() -> Dict[str, Dict[str, str]]:
@@ -582,10 +759,43 @@ def load_existing_meta() -> Dict[str, Dict[str, str]]:
     return {}
 
 
+def load_news_cache() -> Dict[str, Dict[str, Any]]:
+    if not NEWS_CACHE_FILE.exists():
+        return {}
+
+    try:
+        raw = json.loads(NEWS_CACHE_FILE.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+
+    now = dt.datetime.now()
+    fresh = {}
+    for key, entry in raw.items():
+        try:
+            fetched_at = dt.datetime.fromisoformat(entry["fetched_at"])
+            items = entry["items"]
+        except Exception:
+            continue
+        if now - fetched_at <= NEWS_CACHE_TTL and isinstance(items, list):
+            fresh[key] = {"items": items, "fetched_at": entry["fetched_at"]}
+    return fresh
+
+
+def save_news_cache() -> None:
+    # 수집 실패 항목은 다음 실행에서 다시 시도하도록 저장하지 않음
+    payload = {k: v for k, v in NEWS_CACHE.items() if v.get("fetched_at")}
+    NEWS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = NEWS_CACHE_FILE.with_name(NEWS_CACHE_FILE.name + ".tmp")
+    tmp.write_bytes(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    os.replace(tmp, NEWS_CACHE_FILE)
+
+
 def discover_report_dates() -> List[str]:
     dates = []
     for f in REPORT_DIR.glob("*.html"):
-        m = re.fullmatch(r"(\d{4}-\d{2}-\d{2})\.html", f.name)
+        m = REPORT_NAME_RE.fullmatch(f.name)
         if m:
             dates.append(m.group(1))
     return sorted(set(dates))
@@ -604,21 +814,78 @@ def compact_meta(record: Dict[str, str]) -> Dict[str, str]:
     }
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KOSPI/KOSDAQ 데일리 리포트 생성")
+    parser.add_argument("--force", action="store_true", help="이미 생성된 과거 리포트도 모두 다시 생성")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="뉴스 수집과 최신 거래일 리포트 생성을 cProfile로 측정해 출력 (뉴스 스레드 작업은 대기 시간으로 집계됨)",
+    )
+    return parser.parse_args()
+
+
+def is_report_built(label: str, report_meta: Dict[str, Dict[str, str]]) -> bool:
+    # discover_report_dates로 보완된 최소 메타("-")만 있는 경우는 다시 생성
+    meta = report_meta.get(label)
+    return (REPORT_DIR / f"{label}.html").exists() and bool(meta) and meta.get("strong", "-") != "-"
+
+
 def main() -> None:
+    args = parse_args()
     REPORT_DIR.mkdir(parents=True, exist_ok=True)
     report_meta = load_existing_meta()
+    NEWS_CACHE.update(load_news_cache())
 
     today = dt.date.today()
     start = today - dt.timedelta(days=20)
     biz_days = stock.get_previous_business_days(fromdate=start, todate=today)
     target_days = biz_days[-10:]
-
-    for i, day in enumerate(target_days):
-        prev_day = target_days[i - 1] if i > 0 else None
-        next_day = target_days[i + 1] if i + 1 < len(target_days) else None
-        latest_day = target_days[-1]
-        report = build_day_report(day, latest_day, i + 1, len(target_days), prev_day, next_day)
-        (REPORT_DIR / f"{report['date']}.html").write_text(report["html"], encoding="utf-8")
+    # 날짜 문자열은 일자별로 한 번만 만들어 조회/이웃 링크에서 재사용
+    compact_dates = [d.strftime("%Y%m%d") for d in target_days]
+    labels = [d.strftime("%Y-%m-%d") for d in target_days]
+    # KRX 응답이 비어 영업일이 없으면 일자별 처리는 모두 건너뛰고 기존 메타로 인덱스만 다시 생성
+    latest_day = target_days[-1] if target_days else None
+
+    # 지난 거래일의 장마감 데이터는 바뀌지 않으므로 이미 생성된 리포트는 건너뛴다.
+    # 최신일은 수집 시점에 따라 미완성일 수 있어 항상 다시 만들고, 다시 만든 날의 이웃은 이전/다음 링크 갱신을 위해 함께 생성
+    stale = {
+        i
+        for i, label in enumerate(labels)
+        if args.force or i == len(labels) - 1 or not is_report_built(label, report_meta)
+    }
+    rebuild = sorted(stale | {j for i in stale for j in (i - 1, i + 1) if 0 <= j < len(labels)})
+
+    # 일자별 시세 조회는 서로 독립적인 네트워크 I/O이므로 동시에 가져오고, 페이지 조립은 순서대로 진행
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        frames = list(executor.map(fetch_day, [compact_dates[i] for i in rebuild]))
+    movers = [select_movers(frame) for frame in frames]
+
+    # 뉴스 검색 기간을 벗어난 과거 일자는 RSS 요청 자체를 만들지 않고,
+    # 나머지 일자의 (종목, 일자, 방향) 키는 중복 제거 후 한 번에 수집해 페이지 조립 전에 캐시를 채운다
+    targets = {
+        key
+        for i, (_, gainers, losers, _) in zip(rebuild, movers)
+        if (latest_day - target_days[i]).days <= NEWS_LOOKBACK_DAYS
+        for key in news_targets(target_days[i], gainers, losers)
+    }
+    profiler = cProfile.Profile() if args.profile else None
+    news = profiler.runcall(prefetch_news, targets) if profiler else prefetch_news(targets)
+
+    for i, (df, gainers, losers, median_turnover) in zip(rebuild, movers):
+        day = target_days[i]
+        prev_label = labels[i - 1] if i > 0 else None
+        next_label = labels[i + 1] if i + 1 < len(target_days) else None
+        build_args = (
+            day, labels[i], df, gainers, losers, median_turnover, news,
+            i + 1, len(target_days), prev_label, next_label,
+        )
+        if profiler and i == rebuild[-1]:
+            # 뉴스 수집 단계와 최신일 페이지 조립 한 건을 함께 프로파일링해 병목 위치를 확인
+            report = profiler.runcall(build_day_report, *build_args)
+        else:
+            report = build_day_report(*build_args)
+        (REPORT_DIR / f"{report['date']}.html").write_bytes(report["html"].encode("utf-8"))
         report_meta[report["date"]] = {
             "date": report["date"],
             "path": report["path"],
@@ -630,6 +897,9 @@ def main() -> None:
             "top_focus": report["top_focus"],
         }
 
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
     # 누락된 메타는 최소 정보로 보완
     for d in discover_report_dates():
         if d not in report_meta:
@@ -646,12 +916,12 @@ def main() -> None:
 
     reports = [compact_meta(report_meta[d]) for d in sorted(report_meta.keys())]
 
-    INDEX_FILE.write_text(build_index(reports), encoding="utf-8")
-    SITEMAP_FILE.write_text(build_sitemap([r["path"] for r in reports]), encoding="utf-8")
-    REPORT_META_FILE.write_text(
-        json.dumps({r["date"]: r for r in reports}, ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    INDEX_FILE.write_bytes(build_index(reports).encode("utf-8"))
+    SITEMAP_FILE.write_bytes(build_sitemap([r["path"] for r in reports]).encode("utf-8"))
+    REPORT_META_FILE.write_bytes(
+        json.dumps({r["date"]: r for r in reports}, ensure_ascii=False, indent=2).encode("utf-8")
     )
+    save_news_cache()
 
     print("generated", len(reports), "daily report pages")
     print("days", ", ".join(r["date"] for r in reports))